@@ -55,8 +55,12 @@ KEYWORDS = [
 ]
 
 Dependencies:
-- pdfplumber  
-- nltk  
+- PyMuPDF  
+- aiofiles  
+- pyahocorasick  
+- blingfire  
+- orjson  
+- tiktoken  
 - re  
 - Groq Python SDK  
 
@@ -64,66 +68,223 @@ Dependencies:
 """
 
 import os
-import pdfplumber
-import nltk
+import asyncio
+import functools
+import hashlib
+import string
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+import ahocorasick
+import aiofiles
+import pymupdf
+import blingfire
+import orjson
+import tiktoken
 import re
-from nltk.tokenize import sent_tokenize
-from groq import Groq
 from info import GROQ_API_KEY, PDF_DIR, KEYWORDS
 
-# Download necessary NLTK models
-nltk.download('punkt')
-
-# Initialize Groq client
-client = Groq(api_key=GROQ_API_KEY)
+# Groq model used for every summary
+MODEL = "llama-3.3-70b-specdec"
+
+# Maximum number of Groq requests in flight at once
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", 16))
+
+# Batch API settings (set GROQ_USE_BATCH=0 to only use the real-time API)
+GROQ_USE_BATCH = os.getenv("GROQ_USE_BATCH", "1") != "0"
+GROQ_BATCH_TIMEOUT = int(os.getenv("GROQ_BATCH_TIMEOUT", 3600))
+GROQ_BATCH_POLL_INTERVAL = int(os.getenv("GROQ_BATCH_POLL_INTERVAL", 30))
+GROQ_BATCH_MAX_ERRORS = int(os.getenv("GROQ_BATCH_MAX_ERRORS", 5))
+
+# Batch statuses after which the batch no longer changes
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Prompt preceding the text to summarize, formatted with the summary context
+PROMPT_PREFIX_FMT = (
+    "Summarize the following research paper content. Context: {}. "
+    "Use only the information from the text and avoid generalizations. "
+    "Include any links, data, or proofs mentioned in the content.\n\n"
+    "Text:\n"
+)
+
+# Output file templates
+DETAIL_TXT_TMPL = string.Template(
+    "\nFile: $filename\n"
+    "\n\n## Full Summary:\n$full_summary"
+    "\n\n## EV Disadvantages Summary:\n$ev_summary"
+    "\n\n## Extracted Links:\n$links"
+    "\n\n## Extracted Data Points:\n$data_points"
+    "\n\n## References/Proofs:\n$references"
+)
+DETAIL_MD_TMPL = string.Template(
+    "# File: $filename\n"
+    "\n## Full Summary\n$full_summary\n"
+    "\n## EV Disadvantages Summary\n$ev_summary\n"
+    "\n## Extracted Links\n$links\n"
+    "\n## Extracted Data Points\n$data_points\n"
+    "\n## References/Proofs\n$references\n"
+)
+SHORT_TXT_TMPL = string.Template("\nFile: $filename\n\n\n## Short Summary:\n$short_summary")
+SHORT_MD_TMPL = string.Template("# File: $filename\n\n## Short Summary\n$short_summary")
+
+# Summary contexts
+FULL_CONTEXT = "Full PDF Summary"
+EV_CONTEXT = "EV Disadvantages Only"
 
 # Define directories
 SUMMARIES_DIR = os.path.join(PDF_DIR, "Summaries")
 SHORT_SUMMARY_DIR = os.path.join(PDF_DIR, "Short_Summary")
+BATCH_DIR = os.path.join(PDF_DIR, "Batch")
+CACHE_DIR = os.path.join(SHORT_SUMMARY_DIR, ".cache")
+
+# Returned in place of a summary when the API call fails
+API_ERROR_SUMMARY = "Failed to summarize due to API error."
 
 # Chunk size to avoid API token limits
 MAX_TOKENS = 3000  
 
-def extract_text_from_pdf(pdf_path):
+# BPE encoding used to count tokens
+TOKEN_ENCODING = "cl100k_base"
+
+# EV keywords, lowercased and deduplicated once
+KEYWORDS_LC = frozenset(kw.lower() for kw in KEYWORDS)
+
+# Aho-Corasick automaton matching all EV keywords in one pass over a text
+KW_AUTOMATON = ahocorasick.Automaton()
+for kw in KEYWORDS_LC:
+    KW_AUTOMATON.add_word(kw, kw)
+if KEYWORDS_LC:
+    KW_AUTOMATON.make_automaton()
+
+# Patterns used to extract links, numbers and references
+URL_RE = re.compile(r'https?://[^\s]+')
+NUM_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+REF_RE = re.compile(r'(Reference[s]?|Cite[d]?|Source[s]?)[:\s]+(.+)', re.IGNORECASE)
+
+# Number of pages extracted per worker task
+PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", 50))
+
+# Maximum number of papers waiting between, or in flight within, pipeline stages
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", 8))
+
+# Number of PDFs extracted at once
+EXTRACT_WORKERS = os.cpu_count()
+
+def count_pdf_pages(pdf_path):
+    """
+    Count the pages of a PDF file.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+
+    Returns:
+        int: Number of pages.
+    """
+    with pymupdf.open(pdf_path) as doc:
+        return doc.page_count
+
+
+def extract_text_from_pdf(pdf_path, pages=None):
     """
     Extract text content from a PDF file.
 
     Args:
         pdf_path (str): Path to the PDF file.
+        pages (range): 0-based page numbers to extract. All pages if None.
 
     Returns:
         str: Extracted text from the PDF.
     """
-    with pdfplumber.open(pdf_path) as pdf:
-        text = "".join(page.extract_text() or "" for page in pdf.pages)
+    with pymupdf.open(pdf_path) as doc:
+        if pages is None:
+            pages = range(doc.page_count)
+        text = "".join(doc[i].get_text("text") for i in pages)
     return text
 
 
-def extract_links_and_data(text):
+def has_keyword(text):
+    """
+    Check whether text contains any of the EV keywords.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        bool: True if a keyword occurs in the text, ignoring case.
+    """
+    return bool(KEYWORDS_LC) and next(KW_AUTOMATON.iter(text.lower()), None) is not None
+
+
+def index_sentences(sentences):
+    """
+    Join sentences into one buffer so a single regex pass can scan them all.
+
+    The buffer is what blingfire's newline-separated output would be, so
+    offsets into it can be mapped back to sentences without tokenizer spans.
+
+    Args:
+        sentences (list): List of sentences.
+
+    Returns:
+        tuple: Newline-joined sentences (str) and the start offset of each
+        sentence in it (list).
+    """
+    joined = "\n".join(sentences)
+    starts = list(accumulate((len(sent) + 1 for sent in sentences[:-1]), initial=0))
+    return joined, starts
+
+
+def extract_links_and_data(text, sentences):
     """
     Extract URLs, numeric data points, and reference mentions from text.
 
     Args:
         text (str): Input text.
+        sentences (list): Sentences of the text.
 
     Returns:
         tuple: URLs (list), data points (list), and references (list).
     """
-    urls = re.findall(r'(https?://[^\s]+)', text)
+    urls = URL_RE.findall(text)
+
+    # Scan all sentences in one pass and map each match back to its sentence
+    joined, starts = index_sentences(sentences)
 
     data_points = []
-    sentences = sent_tokenize(text)
-    for sentence in sentences:
-        numbers = re.findall(r'\b\d+(\.\d+)?\b', sentence)
-        if numbers:
-            for num in numbers:
-                data_points.append(f"{num} -> {sentence.strip()}")
+    for match in NUM_RE.finditer(joined):
+        sentence = sentences[bisect_right(starts, match.start()) - 1]
+        data_points.append(f"{match.group()} -> {sentence.strip()}")
 
-    references = re.findall(r'(Reference[s]?|Cite[d]?|Source[s]?)[:\s]+(.+)', text, re.IGNORECASE)
+    references = REF_RE.findall(text)
 
     return urls, data_points, references
 
 
+def split_sents(text):
+    """
+    Split text into sentences with blingfire's native sentence splitter.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        list: List of sentences.
+    """
+    return [sent for sent in blingfire.text_to_sentences(text).split("\n") if sent]
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding():
+    """
+    Load the tokenizer used to count tokens on first use.
+
+    Returns:
+        tiktoken.Encoding: BPE tokenizer.
+    """
+    return tiktoken.get_encoding(TOKEN_ENCODING)
+
+
 def chunk_text(text, max_tokens=MAX_TOKENS):
     """
     Split text into smaller chunks based on sentence boundaries.
@@ -133,73 +294,401 @@ def chunk_text(text, max_tokens=MAX_TOKENS):
         max_tokens (int): Maximum number of tokens per chunk.
 
     Returns:
-        list: List of text chunks.
+        list: Sentence lists, one per chunk.
     """
-    sentences = sent_tokenize(text)
-    chunks, current_chunk, current_tokens = [], "", 0
+    sentences = split_sents(text)
+    token_counts = [len(tokens) for tokens in get_encoding().encode_ordinary_batch(sentences)]
+    chunks, current_sents, current_tokens = [], [], 0
 
-    for sent in sentences:
-        sent_tokens = len(sent.split())
+    for sent, sent_tokens in zip(sentences, token_counts):
+        if current_sents and current_tokens + sent_tokens > max_tokens:
+            chunks.append(current_sents)
+            current_sents, current_tokens = [], 0
 
-        if current_tokens + sent_tokens > max_tokens:
-            chunks.append(current_chunk)
-            current_chunk, current_tokens = sent, sent_tokens
-        else:
-            current_chunk += " " + sent
-            current_tokens += sent_tokens
+        current_sents.append(sent)
+        current_tokens += sent_tokens
 
-    if current_chunk:
-        chunks.append(current_chunk)
+    if current_sents:
+        chunks.append(current_sents)
 
     return chunks
 
 
-def summarize_with_groq(text, context="general"):
+@functools.lru_cache(maxsize=None)
+def get_client():
+    """
+    Create the Groq client on first use.
+
+    The SDK is imported here rather than at module level, so worker processes
+    that only extract text never import it.
+
+    Returns:
+        AsyncGroq: Shared Groq client.
+    """
+    from groq import AsyncGroq
+    return AsyncGroq(api_key=GROQ_API_KEY)
+
+
+def build_prompt(text, context):
+    """
+    Build the summarization prompt sent to Groq.
+
+    Args:
+        text (str): Input text.
+        context (str): Summary context.
+
+    Returns:
+        str: Prompt text.
+    """
+    return "".join((PROMPT_PREFIX_FMT.format(context), text, "\n\n"))
+
+
+def build_request_body(text, context):
+    """
+    Build the chat completion request body for a summary.
+
+    Args:
+        text (str): Input text.
+        context (str): Summary context.
+
+    Returns:
+        dict: Request body accepted by the chat completions endpoint.
+    """
+    return {
+        "model": MODEL,
+        "messages": [{"role": "user", "content": build_prompt(text, context)}],
+        "temperature": 0.7,
+        "max_tokens": 4096
+    }
+
+
+def summary_cache_key(text, context):
+    """
+    Compute the cache key of a summary.
+
+    Args:
+        text (str): Input text.
+        context (str): Summary context.
+
+    Returns:
+        str: SHA-256 hex digest of the model, context and text.
+    """
+    return hashlib.sha256(f"{MODEL}|{context}|{text}".encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def load_cached_summary(key):
+    """
+    Load a cached summary from disk.
+
+    Misses raise instead of returning a value, so they are never memoized.
+
+    Args:
+        key (str): Cache key from summary_cache_key.
+
+    Returns:
+        str: Cached summary.
+
+    Raises:
+        FileNotFoundError: If the summary is not cached.
+    """
+    with open(os.path.join(CACHE_DIR, f"{key}.txt"), encoding="utf-8") as cache_file:
+        return cache_file.read()
+
+
+def store_cached_summary(key, summary):
+    """
+    Atomically write a summary to the disk cache.
+
+    Args:
+        key (str): Cache key from summary_cache_key.
+        summary (str): Generated summary.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_path = os.path.join(CACHE_DIR, f"{key}.txt")
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as cache_file:
+        cache_file.write(summary)
+    os.replace(tmp_path, cache_path)
+
+
+def cached_summary(func):
+    """
+    Cache the results of an async summarize function on disk.
+
+    Failed summaries are not cached.
+
+    Args:
+        func (coroutine function): Function taking (client, text, context).
+
+    Returns:
+        coroutine function: Wrapped function.
+    """
+    @functools.wraps(func)
+    async def wrapper(client, text, context="general"):
+        key = summary_cache_key(text, context)
+        try:
+            return load_cached_summary(key)
+        except FileNotFoundError:
+            pass
+
+        summary = await func(client, text, context)
+        if summary != API_ERROR_SUMMARY:
+            store_cached_summary(key, summary)
+        return summary
+
+    return wrapper
+
+
+@cached_summary
+async def summarize_with_groq_async(client, text, context="general"):
     """
     Generate a summary using Groq's LLaMA-3.3-70B model.
 
     Args:
+        client (AsyncGroq): Groq client used for the request.
         text (str): Input text.
         context (str): Summary context.
 
     Returns:
         str: Generated summary.
     """
-    prompt = (
-        f"Summarize the following research paper content. Context: {context}. "
-        f"Use only the information from the text and avoid generalizations. "
-        f"Include any links, data, or proofs mentioned in the content.\n\n"
-        f"Text:\n{text}\n\n"
-    )
-
     try:
-        completion = client.chat.completions.create(
-            model="llama-3.3-70b-specdec",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=4096
-        )
+        completion = await client.chat.completions.create(**build_request_body(text, context))
         return completion.choices[0].message.content.strip()
 
     except Exception as e:
         print(f"Error: API Summarization failed. Details: {e}")
-        return "Failed to summarize due to API error."
+        return API_ERROR_SUMMARY
 
 
-def generate_short_summary(text, max_length=300):
+async def bounded(sem, coro):
     """
-    Generate a short summary focusing on sentences containing specific keywords.
+    Await a coroutine while holding a slot of the given semaphore.
 
     Args:
-        text (str): Input text.
+        sem (asyncio.Semaphore): Semaphore limiting concurrency.
+        coro (coroutine): Coroutine to await.
+
+    Returns:
+        Any: Result of the coroutine.
+    """
+    async with sem:
+        return await coro
+
+
+async def cancel_batch(client, batch_id):
+    """
+    Request cancellation of a batch, ignoring any error.
+
+    Args:
+        client (AsyncGroq): Groq client used for the batch.
+        batch_id (str): ID of the batch to cancel.
+
+    Returns:
+        Batch or None: The batch as returned by the cancel call, or None if
+        the call failed.
+    """
+    try:
+        return await client.batches.cancel(batch_id)
+    except Exception as e:
+        print(f"Error: Could not cancel batch {batch_id}. Details: {e}")
+        return None
+
+
+async def poll_batch(client, batch):
+    """
+    Poll a batch until it reaches a terminal status.
+
+    Failed status or cancel calls are retried on the next poll. A batch still
+    running after GROQ_BATCH_TIMEOUT is cancelled and polled until the
+    cancellation completes. Polling stops after GROQ_BATCH_MAX_ERRORS
+    consecutive failed calls.
+
+    Args:
+        client (AsyncGroq): Groq client used for the batch.
+        batch (Batch): The submitted batch.
+
+    Returns:
+        Batch: The last known state of the batch, which is not terminal if
+        polling gave up.
+    """
+    deadline = time.monotonic() + GROQ_BATCH_TIMEOUT
+    cancel_requested = False
+    errors = 0
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        if not cancel_requested and time.monotonic() > deadline:
+            print(f"Batch {batch.id} timed out, cancelling it.")
+            cancelled = await cancel_batch(client, batch.id)
+            if cancelled is not None:
+                batch = cancelled
+                cancel_requested = True
+                continue
+            # The batch may have finished meanwhile, so check it before retrying
+            errors += 1
+        else:
+            await asyncio.sleep(GROQ_BATCH_POLL_INTERVAL)
+        try:
+            batch = await client.batches.retrieve(batch.id)
+            errors = 0
+        except Exception as e:
+            errors += 1
+            print(f"Error: Could not poll batch {batch.id} "
+                  f"({errors}/{GROQ_BATCH_MAX_ERRORS}). Details: {e}")
+        if errors >= GROQ_BATCH_MAX_ERRORS:
+            print(f"Giving up on batch {batch.id}.")
+            break
+    return batch
+
+
+async def download_batch_output(client, file_id):
+    """
+    Download a batch output file, retrying failed downloads.
+
+    Args:
+        client (AsyncGroq): Groq client used for the batch.
+        file_id (str): ID of the batch output file.
+
+    Returns:
+        bytes: The JSONL output, or b"" if every attempt failed.
+    """
+    for attempt in range(1, GROQ_BATCH_MAX_ERRORS + 1):
+        try:
+            output_file = await client.files.content(file_id)
+            return await output_file.read()
+        except Exception as e:
+            print(f"Error: Could not download batch output {file_id} "
+                  f"({attempt}/{GROQ_BATCH_MAX_ERRORS}). Details: {e}")
+            await asyncio.sleep(GROQ_BATCH_POLL_INTERVAL)
+    return b""
+
+
+async def summarize_with_groq_batch(client, requests):
+    """
+    Generate summaries through Groq's Batch API.
+
+    All requests are staged into one JSONL file, submitted as a single batch
+    and polled until it finishes. A batch still running after
+    GROQ_BATCH_TIMEOUT is cancelled, and the results it already produced are
+    kept. A batch left running by an error is cancelled so it is not billed
+    on top of the real-time fallback.
+
+    Args:
+        client (AsyncGroq): Groq client used for the batch.
+        requests (list): (custom_id, text, context) tuples.
+
+    Returns:
+        dict: Generated summaries keyed by custom_id. Requests the batch did
+        not answer successfully are missing.
+    """
+    os.makedirs(BATCH_DIR, exist_ok=True)
+    batch_path = os.path.join(BATCH_DIR, "batch.jsonl")
+
+    with open(batch_path, "wb") as batch_file:
+        for custom_id, text, context in requests:
+            record = {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": build_request_body(text, context)
+            }
+            batch_file.write(orjson.dumps(record) + b"\n")
+
+    try:
+        with open(batch_path, "rb") as batch_file:
+            uploaded = await client.files.create(file=batch_file, purpose="batch")
+
+        batch = await client.batches.create(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=uploaded.id
+        )
+    except Exception as e:
+        print(f"Error: Batch submission failed. Details: {e}")
+        return {}
+    print(f"Submitted batch {batch.id} with {len(requests)} requests.")
+
+    try:
+        batch = await poll_batch(client, batch)
+    finally:
+        if batch.status not in BATCH_TERMINAL_STATUSES:
+            await cancel_batch(client, batch.id)
+
+    if batch.status != "completed":
+        print(f"Batch {batch.id} ended with status: {batch.status}")
+
+    # Cancelled and expired batches still return the requests they finished
+    if not batch.output_file_id:
+        return {}
+
+    output = await download_batch_output(client, batch.output_file_id)
+
+    summaries = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = orjson.loads(line)
+        response = result.get("response") or {}
+        if response.get("status_code") == 200:
+            content = response["body"]["choices"][0]["message"]["content"]
+            summaries[result["custom_id"]] = content.strip()
+
+    return summaries
+
+
+async def summarize_requests(requests, sem):
+    """
+    Generate summaries for all requests, preferring the Batch API.
+
+    Cached summaries are reused. Requests the batch did not answer are sent
+    concurrently to the real-time API.
+
+    Args:
+        requests (list): (custom_id, text, context) tuples.
+        sem (asyncio.Semaphore): Semaphore limiting concurrent real-time requests.
+
+    Returns:
+        dict: Generated summaries keyed by custom_id.
+    """
+    client = get_client()
+
+    summaries, uncached = {}, []
+    for custom_id, text, context in requests:
+        try:
+            summaries[custom_id] = load_cached_summary(summary_cache_key(text, context))
+        except FileNotFoundError:
+            uncached.append((custom_id, text, context))
+
+    if GROQ_USE_BATCH and uncached:
+        batch_summaries = await summarize_with_groq_batch(client, uncached)
+        for custom_id, text, context in uncached:
+            if custom_id in batch_summaries:
+                store_cached_summary(summary_cache_key(text, context), batch_summaries[custom_id])
+        summaries.update(batch_summaries)
+
+    missing = [request for request in requests if request[0] not in summaries]
+    if missing:
+        print(f"Summarizing {len(missing)} requests with the real-time API.")
+        results = await asyncio.gather(*(
+            bounded(sem, summarize_with_groq_async(client, text, context))
+            for _, text, context in missing
+        ))
+        summaries.update((custom_id, result) for (custom_id, _, _), result in zip(missing, results))
+
+    return summaries
+
+
+def generate_short_summary(ev_sentences, max_length=300):
+    """
+    Generate a short summary from the sentences containing specific keywords.
+
+    Args:
+        ev_sentences (list): Sentences of the input text that contain keywords.
         max_length (int): Maximum word length of the summary.
 
     Returns:
         str: Generated short summary.
     """
-    sentences = sent_tokenize(text)
-    ev_sentences = [sent for sent in sentences if any(kw in sent.lower() for kw in KEYWORDS)]
-
     short_summary, current_length = "", 0
     for sent in ev_sentences:
         words = len(sent.split())
@@ -212,85 +701,338 @@ def generate_short_summary(text, max_length=300):
     return short_summary.strip()
 
 
-if __name__ == "__main__":
-    print("\nResearch Paper Summarization Process Started.\n")
+async def write_file(path, body):
+    """
+    Write text to a file as UTF-8 in a single write.
 
-    # Create output directories
-    os.makedirs(SUMMARIES_DIR, exist_ok=True)
-    os.makedirs(SHORT_SUMMARY_DIR, exist_ok=True)
+    Args:
+        path (str): Output file path.
+        body (str): File content.
+    """
+    async with aiofiles.open(path, "wb") as output_file:
+        await output_file.write(body.encode("utf-8"))
+
+
+async def write_summaries(filename, full_summary, ev_disadvantages_summary,
+                          urls, data_points, references, short_summary):
+    """
+    Write the detailed and short summaries of a paper to their output folders.
+
+    Args:
+        filename (str): Name of the source PDF file.
+        full_summary (str): Chunk-by-chunk summary of the paper.
+        ev_disadvantages_summary (str): Chunk-by-chunk EV disadvantages summary.
+        urls (list): Extracted URLs.
+        data_points (list): Extracted data points.
+        references (list): Extracted references.
+        short_summary (str): Keyword-based short summary.
+
+    Returns:
+        tuple: Detailed summary folder (str) and short summary folder (str).
+    """
+    base_filename = os.path.splitext(filename)[0]
+    paper_folder = os.path.join(SUMMARIES_DIR, base_filename)
+    short_summary_folder = os.path.join(SHORT_SUMMARY_DIR, base_filename)
+    os.makedirs(paper_folder, exist_ok=True)
+    os.makedirs(short_summary_folder, exist_ok=True)
+
+    # Detailed summary files
+    txt_output_path = os.path.join(paper_folder, f"{base_filename}_summary.txt")
+    md_output_path = os.path.join(paper_folder, f"{base_filename}_summary.md")
+
+    # Short summary files
+    short_txt_output_path = os.path.join(short_summary_folder, f"{base_filename}_short_summary.txt")
+    short_md_output_path = os.path.join(short_summary_folder, f"{base_filename}_short_summary.md")
+
+    detail_fields = {
+        "filename": filename,
+        "full_summary": full_summary,
+        "ev_summary": ev_disadvantages_summary,
+        "links": "\n".join(urls) if urls else "No links found",
+        "data_points": "\n".join(data_points) if data_points else "No data points found",
+        "references": "\n".join([" - ".join(ref) for ref in references]) if references else "No references found"
+    }
+    short_fields = {"filename": filename, "short_summary": short_summary}
+
+    await write_file(txt_output_path, DETAIL_TXT_TMPL.substitute(detail_fields))
+    await write_file(md_output_path, DETAIL_MD_TMPL.substitute(detail_fields))
+    await write_file(short_txt_output_path, SHORT_TXT_TMPL.substitute(short_fields))
+    await write_file(short_md_output_path, SHORT_MD_TMPL.substitute(short_fields))
+
+    return paper_folder, short_summary_folder
+
+
+def prepare_paper(filename, full_text):
+    """
+    Extract links, data, chunks and the short summary of a paper ahead of
+    summarization.
+
+    Args:
+        filename (str): Name of the PDF file inside PDF_DIR.
+        full_text (str): Text extracted from the PDF.
+
+    Returns:
+        dict: Extracted paper content.
+    """
+    chunk_sents = chunk_text(full_text)
+    sentences = [sent for sents in chunk_sents for sent in sents]
+    chunks = [" ".join(sents) for sents in chunk_sents]
+
+    # Chunks without keyword sentences get no EV summary request
+    chunk_ev_sents = [[sent for sent in sents if has_keyword(sent)] for sents in chunk_sents]
+    ev_chunks = {i: " ".join(ev_sents) for i, ev_sents in enumerate(chunk_ev_sents) if ev_sents}
+    ev_sentences = [sent for ev_sents in chunk_ev_sents for sent in ev_sents]
+
+    urls, data_points, references = extract_links_and_data(full_text, sentences)
+
+    return {
+        "filename": filename,
+        "base_filename": os.path.splitext(filename)[0],
+        "urls": urls,
+        "data_points": data_points,
+        "references": references,
+        "chunks": chunks,
+        "ev_chunks": ev_chunks,
+        "short_summary": generate_short_summary(ev_sentences)
+    }
+
+
+async def load_paper(filename, pool):
+    """
+    Extract and prepare a PDF in the worker pool.
+
+    PDFs longer than PAGES_PER_TASK pages are split into page ranges that are
+    extracted in parallel.
+
+    Args:
+        filename (str): Name of the PDF file inside PDF_DIR.
+        pool (ProcessPoolExecutor): Pool running the CPU-bound extraction.
+
+    Returns:
+        dict: Extracted paper content.
+    """
+    print(f"Processing file: {filename}")
+
+    loop = asyncio.get_running_loop()
+    pdf_path = os.path.join(PDF_DIR, filename)
+
+    num_pages = await loop.run_in_executor(pool, count_pdf_pages, pdf_path)
+    page_ranges = [range(start, min(start + PAGES_PER_TASK, num_pages))
+                   for start in range(0, num_pages, PAGES_PER_TASK)]
+    parts = await asyncio.gather(*(
+        loop.run_in_executor(pool, extract_text_from_pdf, pdf_path, pages)
+        for pages in page_ranges
+    ))
+
+    return await loop.run_in_executor(pool, prepare_paper, filename, "".join(parts))
+
+
+def build_summary_requests(papers):
+    """
+    Collect the summary requests of every chunk of every paper.
 
-    for filename in os.listdir(PDF_DIR):
-        if filename.endswith(".pdf"):
-            print(f"Processing file: {filename}")
+    Args:
+        papers (list): Papers returned by prepare_paper.
 
-            pdf_path = os.path.join(PDF_DIR, filename)
+    Returns:
+        list: (custom_id, text, context) tuples, with custom_id formatted as
+        "<base_filename>::chunk<i>::<context>".
+    """
+    requests = []
+    for paper in papers:
+        base_filename = paper["base_filename"]
+        for i, chunk in enumerate(paper["chunks"]):
+            requests.append((f"{base_filename}::chunk{i}::{FULL_CONTEXT}", chunk, FULL_CONTEXT))
+        for i, ev_text in paper["ev_chunks"].items():
+            requests.append((f"{base_filename}::chunk{i}::{EV_CONTEXT}", ev_text, EV_CONTEXT))
+    return requests
 
-            full_text = extract_text_from_pdf(pdf_path)
-            urls, data_points, references = extract_links_and_data(full_text)
-            chunks = chunk_text(full_text)
 
-            full_summary, ev_disadvantages_summary = "", ""
+def demux_summaries(summaries):
+    """
+    Route summaries back to their paper, chunk and context.
 
-            for i, chunk in enumerate(chunks):
-                print(f"Summarizing chunk {i+1} of {len(chunks)}.")
+    Args:
+        summaries (dict): Generated summaries keyed by custom_id.
 
-                full_summary += f"\n### Chunk {i+1} Summary:\n"
-                full_summary += summarize_with_groq(chunk, context="Full PDF Summary")
+    Returns:
+        dict: Mapping of base_filename -> context -> {chunk index: summary}.
+    """
+    routed = {}
+    for custom_id, summary in summaries.items():
+        base_filename, chunk, context = custom_id.rsplit("::", 2)
+        i = int(chunk[len("chunk"):])
+        routed.setdefault(base_filename, {}).setdefault(context, {})[i] = summary
+    return routed
 
-                ev_sentences = [sent for sent in sent_tokenize(chunk)
-                                if any(kw in sent.lower() for kw in KEYWORDS)]
-                if ev_sentences:
-                    ev_disadvantages_summary += f"\n### Chunk {i+1} EV Disadvantages:\n"
-                    ev_disadvantages_summary += summarize_with_groq(" ".join(ev_sentences),
-                                                                   context="EV Disadvantages Only")
 
-            base_filename = os.path.splitext(filename)[0]
-            paper_folder = os.path.join(SUMMARIES_DIR, base_filename)
-            short_summary_folder = os.path.join(SHORT_SUMMARY_DIR, base_filename)
-            os.makedirs(paper_folder, exist_ok=True)
-            os.makedirs(short_summary_folder, exist_ok=True)
+async def summarize_papers(papers, sem):
+    """
+    Summarize the given papers.
 
-            # Detailed summary files
-            txt_output_path = os.path.join(paper_folder, f"{base_filename}_summary.txt")
-            md_output_path = os.path.join(paper_folder, f"{base_filename}_summary.md")
+    Args:
+        papers (list): Papers returned by prepare_paper.
+        sem (asyncio.Semaphore): Semaphore limiting concurrent real-time requests.
 
-            # Short summary files
-            short_txt_output_path = os.path.join(short_summary_folder, f"{base_filename}_short_summary.txt")
-            short_md_output_path = os.path.join(short_summary_folder, f"{base_filename}_short_summary.md")
+    Returns:
+        list: (paper, full summary, EV disadvantages summary) tuples.
+    """
+    summaries = await summarize_requests(build_summary_requests(papers), sem)
+    routed = demux_summaries(summaries)
 
-            short_summary = generate_short_summary(full_text)
+    results = []
+    for paper in papers:
+        paper_summaries = routed.get(paper["base_filename"], {})
+        full_chunks = paper_summaries.get(FULL_CONTEXT, {})
+        ev_chunks = paper_summaries.get(EV_CONTEXT, {})
 
-            with open(txt_output_path, "w", encoding="utf-8") as txt_file, \
-                 open(md_output_path, "w", encoding="utf-8") as md_file:
+        full_summary = "".join(f"\n### Chunk {i+1} Summary:\n{full_chunks[i]}"
+                               for i in sorted(full_chunks))
+        ev_disadvantages_summary = "".join(f"\n### Chunk {i+1} EV Disadvantages:\n{ev_chunks[i]}"
+                                           for i in sorted(ev_chunks))
 
-                txt_file.write(f"\nFile: {filename}\n")
-                txt_file.write("\n\n## Full Summary:\n")
-                txt_file.write(full_summary)
+        results.append((paper, full_summary, ev_disadvantages_summary))
 
-                txt_file.write("\n\n## EV Disadvantages Summary:\n")
-                txt_file.write(ev_disadvantages_summary)
+    return results
 
-                txt_file.write("\n\n## Extracted Links:\n")
-                txt_file.write("\n".join(urls) if urls else "No links found")
 
-                txt_file.write("\n\n## Extracted Data Points:\n")
-                txt_file.write("\n".join(data_points) if data_points else "No data points found")
+async def feed_filenames(filenames, queue_in, num_workers):
+    """
+    Pipeline source queueing the PDFs to process.
+
+    Args:
+        filenames (list): Names of the PDF files inside PDF_DIR.
+        queue_in (asyncio.Queue): Receives the filenames, then one None per
+            extractor worker.
+        num_workers (int): Number of extractor workers reading queue_in.
+    """
+    for filename in filenames:
+        await queue_in.put(filename)
+    for _ in range(num_workers):
+        await queue_in.put(None)
 
-                txt_file.write("\n\n## References/Proofs:\n")
-                txt_file.write("\n".join([" - ".join(ref) for ref in references]) if references else "No references found")
 
-            with open(short_txt_output_path, "w", encoding="utf-8") as short_txt, \
-                 open(short_md_output_path, "w", encoding="utf-8") as short_md:
+async def extractor(queue_in, queue_mid, pool):
+    """
+    Pipeline stage worker extracting PDFs in the worker pool.
 
-                short_txt.write(f"\nFile: {filename}\n")
-                short_txt.write("\n\n## Short Summary:\n")
-                short_txt.write(short_summary)
+    A worker only takes the next filename once its last paper has been
+    accepted by queue_mid, so a full queue stalls extraction.
 
-                short_md.write(f"# File: {filename}\n\n")
-                short_md.write("## Short Summary\n")
-                short_md.write(short_summary)
+    Args:
+        queue_in (asyncio.Queue): Filenames to extract, terminated by None.
+        queue_mid (asyncio.Queue): Receives papers as they are extracted.
+        pool (ProcessPoolExecutor): Pool running the CPU-bound extraction.
+    """
+    while (filename := await queue_in.get()) is not None:
+        await queue_mid.put(await load_paper(filename, pool))
+
+
+async def summarizer(queue_mid, queue_out, sem):
+    """
+    Pipeline stage summarizing extracted papers.
+
+    With the Batch API all papers are collected and summarized in one
+    submission, which needs every paper in memory at once. Otherwise each
+    paper is summarized as soon as it arrives, with at most
+    PIPELINE_QUEUE_SIZE papers in flight, so a full queue_out stalls the
+    stage.
+
+    Args:
+        queue_mid (asyncio.Queue): Extracted papers, terminated by None.
+        queue_out (asyncio.Queue): Receives summarized papers, then None.
+        sem (asyncio.Semaphore): Semaphore limiting concurrent real-time requests.
+    """
+    if GROQ_USE_BATCH:
+        papers = []
+        while (paper := await queue_mid.get()) is not None:
+            papers.append(paper)
+
+        for result in await summarize_papers(papers, sem) if papers else []:
+            await queue_out.put(result)
+
+        await queue_out.put(None)
+        return
+
+    slots = asyncio.Semaphore(PIPELINE_QUEUE_SIZE)
+
+    async def summarize_and_forward(paper):
+        try:
+            for result in await summarize_papers([paper], sem):
+                await queue_out.put(result)
+        finally:
+            slots.release()
+
+    jobs = []
+    while True:
+        await slots.acquire()
+        paper = await queue_mid.get()
+        if paper is None:
+            slots.release()
+            break
+        jobs.append(asyncio.create_task(summarize_and_forward(paper)))
+
+    await asyncio.gather(*jobs)
+    await queue_out.put(None)
+
+
+async def writer(queue_out):
+    """
+    Pipeline stage writing summarized papers to disk.
+
+    Args:
+        queue_out (asyncio.Queue): Summarized papers, terminated by None.
+    """
+    while (result := await queue_out.get()) is not None:
+        paper, full_summary, ev_disadvantages_summary = result
+        filename = paper["filename"]
+
+        paper_folder, short_summary_folder = await write_summaries(
+            filename, full_summary, ev_disadvantages_summary,
+            paper["urls"], paper["data_points"], paper["references"], paper["short_summary"]
+        )
+
+        print(f"Summarization completed for: {filename}")
+        print(f"Output saved in:\n   - {paper_folder}\n   - {short_summary_folder}\n")
+
+
+async def process_all():
+    """
+    Process every PDF in PDF_DIR.
+
+    Extraction, summarization and writing run as concurrent pipeline stages
+    connected by bounded queues, so one PDF can be extracted while another is
+    being summarized and a third is being written. A stage that falls behind
+    stalls the stages feeding it, which caps the number of papers in memory.
+    """
+    filenames = [filename for filename in os.listdir(PDF_DIR) if filename.endswith(".pdf")]
+    sem = asyncio.Semaphore(GROQ_MAX_CONCURRENCY)
+    queue_in = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    queue_mid = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    queue_out = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        async def extract_all():
+            await asyncio.gather(
+                feed_filenames(filenames, queue_in, EXTRACT_WORKERS),
+                *(extractor(queue_in, queue_mid, pool) for _ in range(EXTRACT_WORKERS))
+            )
+            await queue_mid.put(None)
+
+        await asyncio.gather(
+            extract_all(),
+            summarizer(queue_mid, queue_out, sem),
+            writer(queue_out)
+        )
+
+
+if __name__ == "__main__":
+    print("\nResearch Paper Summarization Process Started.\n")
+
+    # Create output directories
+    os.makedirs(SUMMARIES_DIR, exist_ok=True)
+    os.makedirs(SHORT_SUMMARY_DIR, exist_ok=True)
 
-            print(f"Summarization completed for: {filename}")
-            print(f"Output saved in:\n   - {paper_folder}\n   - {short_summary_folder}\n")
+    asyncio.run(process_all())
 
     print("All research papers have been processed successfully.\n")